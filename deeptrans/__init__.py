@@ -8,6 +8,8 @@ from deeptrans.client import (
     ModelType
 )
 
+from deeptrans.runner import ShardedTranslator
+
 from deeptrans.exceptions import (
     DeepLException,
     AuthorizationException,
@@ -28,5 +30,7 @@ from deeptrans.models import (
     ModelType,
     TextResult,
     Usage,
-    Language
+    Language,
+    GlossaryInfo,
+    WorkerStats
 )
\ No newline at end of file
@@ -1,5 +1,7 @@
 import aiohttp
 import asyncio
+import hashlib
+import os
 from typing import Union, List, Optional, Dict, Any
 
 from deeptrans.exceptions import (
@@ -21,7 +23,8 @@ from deeptrans.models import (
     ModelType,
     TextResult,
     Usage,
-    Language
+    Language,
+    GlossaryInfo
 )
 
 
@@ -40,6 +43,9 @@ class AsyncDeepLClient:
     _DEEPL_SERVER_URL = "https://api.deepl.com"
     _DEEPL_SERVER_URL_FREE = "https://api-free.deepl.com"
     _HTTP_STATUS_QUOTA_EXCEEDED = 456
+    _GLOSSARY_NAME_PREFIX = "deeptrans-"
+    _GLOSSARY_FILE_CHUNK_SIZE = 64 * 1024
+    _GLOSSARY_DIGEST_EXECUTOR_THRESHOLD = 1000
     
     def __init__(
         self,
@@ -73,6 +79,13 @@ class AsyncDeepLClient:
             "Content-Type": "application/json",
             "User-Agent": "deepl-python-async/1.0.0"
         }
+        
+        # Maps "source:target:content hash" to the ID of an existing glossary
+        self._glossary_registry: Dict[str, str] = {}
+        self._glossary_registry_synced = False
+        self._glossary_lock: Optional[asyncio.Lock] = None
+        # Maps (real path, size, mtime, format) of glossary files to their content hash
+        self._glossary_file_digests: Dict[tuple, str] = {}
     
     @staticmethod
     def _is_free_account(auth_key: str) -> bool:
@@ -104,11 +117,13 @@ class AsyncDeepLClient:
         self,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        method: str = "POST"
+        method: str = "POST",
+        headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         """Make an HTTP request to the DeepL API with retries."""
         url = f"{self.server_url}/{endpoint.lstrip('/')}"
         session = self._get_session()
+        request_headers = {**self.headers, **headers} if headers else self.headers
         
         if "languages" in endpoint and method == "GET" :
             try:
@@ -122,17 +137,20 @@ class AsyncDeepLClient:
                     method,
                     url,
                     json=data if data else None,
-                    headers=self.headers
+                    headers=request_headers
                 ) as response:
                     content = await response.text()
                     
                     # Handle different HTTP status codes
-                    if response.status == 200:
+                    if response.status in (200, 201):
                         try:
                             return await response.json()
                         except aiohttp.ContentTypeError:
                             return {"text": content}
                     
+                    elif response.status == 204:
+                        return {}
+                    
                     elif response.status == 401:
                         raise AuthorizationException(
                             "Invalid authentication key",
@@ -146,8 +164,14 @@ class AsyncDeepLClient:
                         )
                     
                     elif response.status == 404:
+                        error_info = ""
+                        try:
+                            error_json = await response.json()
+                            error_info = f": {error_json['message']}"
+                        except:
+                            pass
                         raise DeepLException(
-                            "Not found, check server_url",
+                            f"Not found, check server_url{error_info}",
                             http_status_code=response.status
                         )
                     
@@ -212,6 +236,7 @@ class AsyncDeepLClient:
         split_sentences: Union[str, SplitSentences] = SplitSentences.ON,
         formality: Union[str, Formality] = Formality.DEFAULT,
         glossary_id: Optional[str] = None,
+        glossary: Optional[Union[Dict[str, str], str, "os.PathLike[str]"]] = None,
         context: Optional[str] = None,
         tag_handling: Optional[str] = None,
         outline_detection: Optional[bool] = None,
@@ -231,6 +256,13 @@ class AsyncDeepLClient:
             split_sentences: How to split sentences. Default: SplitSentences.ON.
             formality: Formality level. Default: Formality.DEFAULT.
             glossary_id: ID of glossary to use for translation.
+            glossary: Glossary given by content, either a dict of entries or the path
+                to a TSV/CSV file. It is resolved to an existing glossary with the same
+                content and language pair, or created once. If that glossary was deleted
+                meanwhile, it is resolved again and the request is retried once.
+                Requires source_lang. A dict is hashed on every call, so for repeated
+                translations prefer passing the ID returned by get_or_create_glossary
+                as glossary_id.
             context: Additional context to influence translation.
             tag_handling: Type of tags to handle ("xml" or "html").
             outline_detection: Whether to enable outline detection for XML.
@@ -287,6 +319,22 @@ class AsyncDeepLClient:
         elif formality != "default":
             request_data["formality"] = formality
         
+        if glossary is not None:
+            if glossary_id:
+                raise ValueError("glossary and glossary_id are mutually exclusive")
+            if "source_lang" not in request_data:
+                if source_lang:
+                    raise ValueError(
+                        f"source_lang is required when using a glossary, "
+                        f"unknown source_lang: {source_lang}"
+                    )
+                raise ValueError("source_lang is required when using a glossary")
+            glossary_id = await self.get_or_create_glossary(
+                glossary,
+                source_lang=request_data["source_lang"],
+                target_lang=target_lang
+            )
+        
         if glossary_id:
             request_data["glossary_id"] = glossary_id
         
@@ -317,7 +365,19 @@ class AsyncDeepLClient:
             request_data["show_billed_characters"] = True
 
         # Make request
-        response = await self._make_request("v2/translate", request_data)
+        try:
+            response = await self._make_request("v2/translate", request_data)
+        except DeepLException as e:
+            if glossary is None or not self._is_glossary_missing(e):
+                raise
+            # The cached glossary was deleted elsewhere, resolve it again and retry once
+            self._forget_glossary(request_data["glossary_id"])
+            request_data["glossary_id"] = await self.get_or_create_glossary(
+                glossary,
+                source_lang=request_data["source_lang"],
+                target_lang=target_lang
+            )
+            response = await self._make_request("v2/translate", request_data)
         
         # Parse response
         translations = response.get("translations", [])
@@ -366,4 +426,290 @@ class AsyncDeepLClient:
                 supports_formality=lang.get("supports_formality", False)
             )
             for lang in response
-        ]
\ No newline at end of file
+        ]
+    
+    @staticmethod
+    def _is_glossary_missing(exception: DeepLException) -> bool:
+        """Check if a failed request was caused by an unknown glossary."""
+        return (
+            exception.http_status_code in (400, 404)
+            and "glossary" in str(exception).lower()
+        )
+    
+    def _forget_glossary(self, glossary_id: str) -> None:
+        """Remove a glossary from the registry, so it is looked up again on next use."""
+        self._glossary_registry = {
+            key: value
+            for key, value in self._glossary_registry.items()
+            if value != glossary_id
+        }
+        self._glossary_registry_synced = False
+    
+    @staticmethod
+    def _glossary_lang(lang: str, source: bool = False) -> str:
+        """Convert a language code or name to the base code used by glossaries."""
+        if not lang:
+            raise ValueError("source_lang and target_lang are required for glossaries")
+        lang = lang.lower()
+        if source and lang in SOURCE_LANGNAMES:
+            lang = SOURCE_LANGCODES.get(lang, lang)
+        elif not source and lang in LANGNAMES:
+            lang = LANGCODES.get(lang, lang)
+        return lang.split("-")[0]
+    
+    @staticmethod
+    def _glossary_entries_to_tsv(entries: Dict[str, str]) -> str:
+        """Serialize glossary entries to the TSV format expected by the API."""
+        if not entries:
+            raise ValueError("glossary entries must not be empty")
+        lines = []
+        for source, target in entries.items():
+            for term in (source, target):
+                if not term or not term.strip():
+                    raise ValueError("glossary terms must not be empty")
+                if "\t" in term or "\n" in term or "\r" in term:
+                    raise ValueError(f"glossary term contains a tab or newline: {term!r}")
+            lines.append(f"{source}\t{target}")
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _glossary_file_format(path: Union[str, "os.PathLike[str]"]) -> str:
+        """Guess the entries format of a glossary file from its extension."""
+        extension = os.path.splitext(os.fspath(path))[1].lower()
+        if extension == ".csv":
+            return "csv"
+        if extension in (".tsv", ".tab", ".txt"):
+            return "tsv"
+        raise ValueError(f"Cannot guess glossary format of {path}, use entries_format")
+    
+    @staticmethod
+    def _glossary_digest(entries: Dict[str, str]) -> str:
+        """Hash glossary entries independently of their order, in a single pass."""
+        total = 0
+        for source, target in entries.items():
+            entry = hashlib.sha256(f"{source}\t{target}".encode("utf-8")).digest()
+            total = (total + int.from_bytes(entry, "big")) % (1 << 256)
+        digest = hashlib.sha256(b"tsv\0" + total.to_bytes(32, "big"))
+        return digest.hexdigest()[:32]
+    
+    @classmethod
+    def _glossary_file_digest(cls, path: Union[str, "os.PathLike[str]"], entries_format: str) -> str:
+        """Hash a glossary file by streaming it in chunks."""
+        digest = hashlib.sha256(f"{entries_format}\0".encode("utf-8"))
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(cls._GLOSSARY_FILE_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()[:32]
+    
+    async def _glossary_file_digest_cached(self, path: Union[str, "os.PathLike[str]"], entries_format: str) -> str:
+        """Get the digest of a glossary file, hashing it only when it has changed."""
+        path = os.path.realpath(path)
+        stat = os.stat(path)
+        cache_key = (path, stat.st_size, stat.st_mtime_ns, entries_format)
+        digest = self._glossary_file_digests.get(cache_key)
+        if digest is None:
+            digest = await asyncio.get_running_loop().run_in_executor(
+                None, self._glossary_file_digest, path, entries_format
+            )
+            self._glossary_file_digests[cache_key] = digest
+        return digest
+    
+    @staticmethod
+    def _read_text_file(path: Union[str, "os.PathLike[str]"]) -> str:
+        """Read a whole UTF-8 text file."""
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    
+    @staticmethod
+    def _parse_glossary(glossary: Dict[str, Any]) -> GlossaryInfo:
+        """Build a GlossaryInfo from an API response."""
+        return GlossaryInfo(
+            glossary_id=glossary.get("glossary_id", ""),
+            name=glossary.get("name", ""),
+            source_lang=glossary.get("source_lang", ""),
+            target_lang=glossary.get("target_lang", ""),
+            entry_count=glossary.get("entry_count", 0),
+            ready=glossary.get("ready", False),
+            creation_time=glossary.get("creation_time")
+        )
+    
+    async def _create_glossary(
+        self,
+        name: str,
+        source_lang: str,
+        target_lang: str,
+        entries: str,
+        entries_format: str
+    ) -> GlossaryInfo:
+        """Upload serialized glossary entries."""
+        if not name:
+            raise ValueError("glossary name must not be empty")
+        response = await self._make_request("v2/glossaries", {
+            "name": name,
+            "source_lang": self._glossary_lang(source_lang, source=True),
+            "target_lang": self._glossary_lang(target_lang),
+            "entries": entries,
+            "entries_format": entries_format
+        })
+        return self._parse_glossary(response)
+    
+    async def create_glossary(
+        self,
+        name: str,
+        *,
+        source_lang: str,
+        target_lang: str,
+        entries: Dict[str, str]
+    ) -> GlossaryInfo:
+        """
+        Create a glossary from a dict of entries.
+        
+        Args:
+            name: Name of the glossary.
+            source_lang: Language of the source terms.
+            target_lang: Language of the target terms.
+            entries: Mapping of source terms to target terms.
+            
+        Returns:
+            GlossaryInfo of the created glossary.
+        """
+        return await self._create_glossary(
+            name, source_lang, target_lang,
+            self._glossary_entries_to_tsv(entries), "tsv"
+        )
+    
+    async def create_glossary_from_file(
+        self,
+        name: str,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        source_lang: str,
+        target_lang: str,
+        entries_format: Optional[str] = None
+    ) -> GlossaryInfo:
+        """
+        Create a glossary from a TSV or CSV file.
+        
+        Args:
+            name: Name of the glossary.
+            path: Path to the file containing the entries.
+            source_lang: Language of the source terms.
+            target_lang: Language of the target terms.
+            entries_format: "tsv" or "csv". If None, guessed from the file extension.
+            
+        Returns:
+            GlossaryInfo of the created glossary.
+        """
+        entries_format = entries_format or self._glossary_file_format(path)
+        entries = await asyncio.get_running_loop().run_in_executor(None, self._read_text_file, path)
+        return await self._create_glossary(name, source_lang, target_lang, entries, entries_format)
+    
+    async def get_glossary(self, glossary_id: str) -> GlossaryInfo:
+        """Get information about a glossary."""
+        response = await self._make_request(f"v2/glossaries/{glossary_id}", method="GET")
+        return self._parse_glossary(response)
+    
+    async def list_glossaries(self) -> List[GlossaryInfo]:
+        """Get list of all glossaries of the account."""
+        response = await self._make_request("v2/glossaries", method="GET")
+        return [self._parse_glossary(glossary) for glossary in response.get("glossaries", [])]
+    
+    async def get_glossary_entries(self, glossary_id: str) -> Dict[str, str]:
+        """Get the entries of a glossary."""
+        response = await self._make_request(
+            f"v2/glossaries/{glossary_id}/entries",
+            method="GET",
+            headers={"Accept": "text/tab-separated-values"}
+        )
+        entries = {}
+        for line in response.get("text", "").splitlines():
+            if "\t" in line:
+                source, target = line.split("\t", 1)
+                entries[source] = target
+        return entries
+    
+    async def delete_glossary(self, glossary_id: str) -> None:
+        """Delete a glossary."""
+        await self._make_request(f"v2/glossaries/{glossary_id}", method="DELETE")
+        self._forget_glossary(glossary_id)
+    
+    async def _sync_glossary_registry(self) -> None:
+        """Register glossaries previously created by get_or_create_glossary."""
+        for glossary in await self.list_glossaries():
+            if glossary.name.startswith(self._GLOSSARY_NAME_PREFIX):
+                digest = glossary.name[len(self._GLOSSARY_NAME_PREFIX):]
+                key = f"{glossary.source_lang.lower()}:{glossary.target_lang.lower()}:{digest}"
+                self._glossary_registry.setdefault(key, glossary.glossary_id)
+        self._glossary_registry_synced = True
+    
+    async def get_or_create_glossary(
+        self,
+        glossary: Union[Dict[str, str], str, "os.PathLike[str]"],
+        *,
+        source_lang: str,
+        target_lang: str
+    ) -> str:
+        """
+        Get the ID of a glossary with the given content, creating it only if needed.
+        
+        Glossaries are identified by a hash of their entries and language pair, so
+        identical glossaries are reused across requests and across client instances.
+        Files are only hashed again when their size or modification time changes,
+        so a known file costs a single stat. Dicts are hashed on each call, off the
+        event loop when they are large: keep the returned ID and pass it as
+        glossary_id to translate_text to skip this work on later requests.
+        
+        Args:
+            glossary: Dict of entries or path to a TSV/CSV file.
+            source_lang: Language of the source terms.
+            target_lang: Language of the target terms.
+            
+        Returns:
+            The glossary ID.
+        """
+        source_lang = self._glossary_lang(source_lang, source=True)
+        target_lang = self._glossary_lang(target_lang)
+        
+        if isinstance(glossary, dict):
+            entries_format = "tsv"
+            if len(glossary) > self._GLOSSARY_DIGEST_EXECUTOR_THRESHOLD:
+                digest = await asyncio.get_running_loop().run_in_executor(
+                    None, self._glossary_digest, dict(glossary)
+                )
+            else:
+                digest = self._glossary_digest(glossary)
+        else:
+            entries_format = self._glossary_file_format(glossary)
+            digest = await self._glossary_file_digest_cached(glossary, entries_format)
+        
+        key = f"{source_lang}:{target_lang}:{digest}"
+        glossary_id = self._glossary_registry.get(key)
+        if glossary_id:
+            return glossary_id
+        
+        if self._glossary_lock is None:
+            self._glossary_lock = asyncio.Lock()
+        
+        async with self._glossary_lock:
+            if key not in self._glossary_registry and not self._glossary_registry_synced:
+                await self._sync_glossary_registry()
+            if key not in self._glossary_registry:
+                name = f"{self._GLOSSARY_NAME_PREFIX}{digest}"
+                if isinstance(glossary, dict):
+                    info = await self.create_glossary(
+                        name,
+                        source_lang=source_lang,
+                        target_lang=target_lang,
+                        entries=glossary
+                    )
+                else:
+                    info = await self.create_glossary_from_file(
+                        name,
+                        glossary,
+                        source_lang=source_lang,
+                        target_lang=target_lang,
+                        entries_format=entries_format
+                    )
+                self._glossary_registry[key] = info.glossary_id
+        
+        return self._glossary_registry[key]
@@ -94,4 +94,55 @@ class Usage:
         character_limit (int): Maximum number of characters allowed in the current billing period.
     """
     character_count: int
-    character_limit: int
\ No newline at end of file
+    character_limit: int
+
+@dataclass
+class GlossaryInfo:
+    """
+    Glossary information.
+    
+    Attributes:
+        glossary_id (str): Unique ID of the glossary.
+        name (str): Name of the glossary.
+        source_lang (str): Source language code of the glossary entries.
+        target_lang (str): Target language code of the glossary entries.
+        entry_count (int): Number of entries in the glossary.
+        ready (bool): Whether the glossary can already be used for translations.
+        creation_time (str, optional): Creation time of the glossary (ISO 8601).
+    """
+    glossary_id: str
+    name: str
+    source_lang: str
+    target_lang: str
+    entry_count: int = 0
+    ready: bool = False
+    creation_time: Optional[str] = None
+
+
+@dataclass
+class WorkerStats:
+    """
+    Throughput statistics of a ShardedTranslator worker process.
+    
+    Attributes:
+        worker_id (int): Index of the worker process.
+        requests (int): Number of requests sent to the API.
+        texts (int): Number of texts translated.
+        characters (int): Number of source characters translated.
+        elapsed (float): Time spent by the worker, in seconds.
+    """
+    worker_id: int
+    requests: int = 0
+    texts: int = 0
+    characters: int = 0
+    elapsed: float = 0.0
+    
+    @property
+    def texts_per_second(self) -> float:
+        """Number of texts translated per second."""
+        return self.texts / self.elapsed if self.elapsed else 0.0
+    
+    @property
+    def characters_per_second(self) -> float:
+        """Number of source characters translated per second."""
+        return self.characters / self.elapsed if self.elapsed else 0.0
@@ -0,0 +1,390 @@
+import asyncio
+import multiprocessing
+import os
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Union, TextIO, Deque
+
+from deeptrans.client import AsyncDeepLClient
+
+from deeptrans.exceptions import (
+    DeepLException,
+    QuotaExceededException
+)
+
+from deeptrans.models import (
+    TextResult,
+    WorkerStats
+)
+
+
+class _SharedLimiter:
+    """
+    Rate limit and character budget shared by all worker processes.
+    
+    State lives in shared memory, so every worker sees the same request slots
+    and the same remaining budget. Only the first attempt of a request takes a
+    slot: retries made by AsyncDeepLClient after a 429 or 5xx response are not
+    rate limited here.
+    """
+    
+    def __init__(
+        self,
+        ctx,
+        requests_per_second: Optional[float] = None,
+        character_budget: Optional[int] = None
+    ):
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if character_budget is not None and character_budget < 0:
+            raise ValueError("character_budget must not be negative")
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.limited_budget = character_budget is not None
+        self._lock = ctx.Lock()
+        self._next_slot = ctx.RawValue("d", 0.0)
+        self._budget = ctx.RawValue("q", character_budget or 0)
+    
+    async def acquire(self, characters: int) -> None:
+        """Reserve characters from the budget and wait for the next request slot."""
+        with self._lock:
+            if self.limited_budget:
+                if characters > self._budget.value:
+                    raise QuotaExceededException("Character budget exceeded")
+                self._budget.value -= characters
+            now = time.monotonic()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def release(self, characters: int) -> None:
+        """Give back characters reserved for a request that failed."""
+        if self.limited_budget:
+            with self._lock:
+                self._budget.value += characters
+
+
+def _worker_process(
+    worker_id: int,
+    auth_key: str,
+    client_options: Dict[str, Any],
+    options: Dict[str, Any],
+    tasks,
+    results,
+    limiter: _SharedLimiter,
+    concurrency: int
+) -> None:
+    """Entry point of a worker process, running its own event loop."""
+    asyncio.run(_worker_main(
+        worker_id, auth_key, client_options, options, tasks, results, limiter, concurrency
+    ))
+
+
+async def _worker_main(
+    worker_id: int,
+    auth_key: str,
+    client_options: Dict[str, Any],
+    options: Dict[str, Any],
+    tasks,
+    results,
+    limiter: _SharedLimiter,
+    concurrency: int
+) -> None:
+    """Translate batches from the task queue until the stop sentinel is received."""
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    stats = WorkerStats(worker_id=worker_id)
+    start = time.perf_counter()
+    
+    async def read_tasks(executor: ThreadPoolExecutor):
+        while True:
+            task = await loop.run_in_executor(executor, tasks.get)
+            if task is None:
+                for _ in range(concurrency):
+                    await pending.put(None)
+                return
+            await pending.put(task)
+    
+    async def translate_batches(client: AsyncDeepLClient):
+        while True:
+            task = await pending.get()
+            if task is None:
+                return
+            index, batch = task
+            characters = sum(len(text) for text in batch)
+            try:
+                await limiter.acquire(characters)
+            except Exception as e:
+                results.put(("error", index, e))
+                continue
+            try:
+                translated = await client.translate_text(batch, **options)
+            except Exception as e:
+                limiter.release(characters)
+                results.put(("error", index, e))
+                continue
+            stats.requests += 1
+            stats.texts += len(batch)
+            stats.characters += characters
+            results.put(("result", index, translated))
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        async with AsyncDeepLClient(auth_key, **client_options) as client:
+            await asyncio.gather(
+                read_tasks(executor),
+                *[translate_batches(client) for _ in range(concurrency)]
+            )
+    
+    stats.elapsed = time.perf_counter() - start
+    results.put(("stats", worker_id, stats))
+
+
+class ShardedTranslator:
+    """
+    Translate a large corpus by sharding it across worker processes.
+    
+    Each worker runs its own AsyncDeepLClient on its own event loop, so the
+    Python-side work around each request scales with the number of cores.
+    The rate limit and character budget are shared by all workers.
+    
+    Args:
+        auth_key (str): Your DeepL API authentication key.
+        workers (int, optional): Number of worker processes. If None, uses the number of CPUs.
+        concurrency (int): Number of requests in flight per worker. Default: 4.
+        batch_size (int): Number of texts sent per request. Default: 50.
+        requests_per_second (float, optional): Global rate limit across all workers. Default: unlimited.
+            Retries after a 429 or 5xx response are not counted, lower max_retries to bound them.
+        character_budget (int, optional): Maximum number of characters to translate. Default: unlimited.
+        server_url (str, optional): Custom server URL. If None, automatically detects free/pro.
+        max_retries (int): Maximum number of retries for failed requests. Default: 5.
+        timeout (int): Request timeout in seconds. Default: 2.
+    """
+    
+    def __init__(
+        self,
+        auth_key: str,
+        *,
+        workers: Optional[int] = None,
+        concurrency: int = 4,
+        batch_size: int = 50,
+        requests_per_second: Optional[float] = None,
+        character_budget: Optional[int] = None,
+        server_url: Optional[str] = None,
+        max_retries: int = 5,
+        timeout: int = 2
+    ):
+        if not auth_key:
+            raise ValueError("auth_key must not be empty")
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not 1 <= batch_size <= 50:
+            raise ValueError("batch_size must be between 1 and 50")
+        
+        self.auth_key = auth_key
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.requests_per_second = requests_per_second
+        self.character_budget = character_budget
+        self.client_options = {
+            "server_url": server_url,
+            "max_retries": max_retries,
+            "timeout": timeout
+        }
+        self.stats: List[WorkerStats] = []
+    
+    def _batches(self, texts: Iterable[str]) -> Iterator[List[str]]:
+        """Group texts into request-sized batches."""
+        batch = []
+        for text in texts:
+            if not isinstance(text, str):
+                raise TypeError("texts must be an iterable of strings")
+            batch.append(text)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    async def _resolve_glossary(self, glossary, source_lang: str, target_lang: str) -> str:
+        """Resolve a glossary once, so workers do not each create their own copy."""
+        async with AsyncDeepLClient(self.auth_key, **self.client_options) as client:
+            return await client.get_or_create_glossary(
+                glossary, source_lang=source_lang, target_lang=target_lang
+            )
+    
+    def translate(self, texts: Iterable[str], *, target_lang: str, **options) -> Iterator[TextResult]:
+        """
+        Translate texts across worker processes.
+        
+        Texts are read lazily and results are yielded in input order as soon as
+        they are available. Per-worker statistics are stored in `stats` once
+        the iterator is exhausted.
+        
+        Args:
+            texts: Iterable of texts to translate.
+            target_lang: Target language code (e.g., "DE", "EN-US", "FR").
+            **options: Other arguments of AsyncDeepLClient.translate_text.
+        
+        Returns:
+            Iterator of TextResult, in the same order as texts.
+        """
+        options["target_lang"] = target_lang
+        if options.get("glossary") is not None:
+            if options.get("glossary_id"):
+                raise ValueError("glossary and glossary_id are mutually exclusive")
+            if not options.get("source_lang"):
+                raise ValueError("source_lang is required when using a glossary")
+            options["glossary_id"] = asyncio.run(self._resolve_glossary(
+                options.pop("glossary"), options["source_lang"], target_lang
+            ))
+        
+        ctx = multiprocessing.get_context()
+        limiter = _SharedLimiter(ctx, self.requests_per_second, self.character_budget)
+        max_pending = self.workers * self.concurrency * 2
+        tasks = ctx.Queue(maxsize=max_pending)
+        results = ctx.Queue()
+        processes = []
+        
+        self.stats = []
+        batches = enumerate(self._batches(texts))
+        buffered: Dict[int, List[TextResult]] = {}
+        next_index = 0
+        sent = 0
+        exhausted = False
+        finished = False
+        
+        try:
+            for worker_id in range(self.workers):
+                process = ctx.Process(
+                    target=_worker_process,
+                    args=(
+                        worker_id, self.auth_key, self.client_options, options,
+                        tasks, results, limiter, self.concurrency
+                    ),
+                    daemon=True
+                )
+                process.start()
+                processes.append(process)
+            
+            while not exhausted or next_index < sent:
+                # Keep workers busy without reading the whole corpus in memory
+                while not exhausted and sent - next_index < max_pending:
+                    try:
+                        tasks.put(next(batches))
+                        sent += 1
+                    except StopIteration:
+                        exhausted = True
+                
+                if next_index == sent:
+                    continue
+                
+                kind, index, payload = self._get_result(results, processes)
+                if kind == "error":
+                    raise payload
+                if kind == "stats":
+                    self.stats.append(payload)
+                    continue
+                buffered[index] = payload
+                
+                while next_index in buffered:
+                    yield from buffered.pop(next_index)
+                    next_index += 1
+            
+            for _ in processes:
+                tasks.put(None)
+            while len(self.stats) < len(processes):
+                kind, index, payload = self._get_result(results, processes, stopping=True)
+                if kind == "stats":
+                    self.stats.append(payload)
+            self.stats.sort(key=lambda stats: stats.worker_id)
+            finished = True
+        
+        finally:
+            if finished:
+                for process in processes:
+                    process.join()
+            else:
+                # Nobody reads the queued batches anymore, do not wait for them to be flushed
+                tasks.cancel_join_thread()
+                for process in processes:
+                    process.terminate()
+                    process.join()
+            tasks.close()
+            results.close()
+    
+    @staticmethod
+    def _get_result(results, processes, stopping: bool = False) -> tuple:
+        """
+        Wait for the next message from the workers, failing if one of them died.
+        
+        Before the stop sentinels are sent no worker may exit, since the batches
+        it was holding would never come back. After that, workers may only exit cleanly.
+        """
+        while True:
+            try:
+                return results.get(timeout=1)
+            except queue.Empty:
+                for process in processes:
+                    if process.exitcode is not None and (not stopping or process.exitcode != 0):
+                        raise DeepLException(
+                            f"Worker process exited unexpectedly with code {process.exitcode}"
+                        )
+                if not any(process.is_alive() for process in processes):
+                    raise DeepLException("All worker processes exited unexpectedly")
+    
+    def translate_file(
+        self,
+        input_file: Union[str, "os.PathLike[str]", TextIO],
+        output_file: Union[str, "os.PathLike[str]", TextIO],
+        *,
+        target_lang: str,
+        **options
+    ) -> List[WorkerStats]:
+        """
+        Translate a file line by line, streaming translations to another file.
+        
+        Empty lines are kept as-is and are not sent to the API.
+        
+        Args:
+            input_file: Path or text file to read, one text per line.
+            output_file: Path or text file to write, one translation per line.
+            target_lang: Target language code (e.g., "DE", "EN-US", "FR").
+            **options: Other arguments of AsyncDeepLClient.translate_text.
+        
+        Returns:
+            List of WorkerStats, one per worker process.
+        """
+        input_stream = open(input_file, "r", encoding="utf-8") if not hasattr(input_file, "read") else input_file
+        output_stream = open(output_file, "w", encoding="utf-8") if not hasattr(output_file, "write") else output_file
+        
+        try:
+            # Whether each line read but not yet written is translated, in order
+            pending_lines: Deque[bool] = deque()
+            
+            def texts():
+                for line in input_stream:
+                    line = line.rstrip("\r\n")
+                    pending_lines.append(bool(line.strip()))
+                    if pending_lines[-1]:
+                        yield line
+            
+            for result in self.translate(texts(), target_lang=target_lang, **options):
+                while not pending_lines[0]:
+                    output_stream.write("\n")
+                    pending_lines.popleft()
+                output_stream.write(result.text.replace("\n", " ") + "\n")
+                pending_lines.popleft()
+            output_stream.write("\n" * len(pending_lines))
+        
+        finally:
+            if input_stream is not input_file:
+                input_stream.close()
+            if output_stream is not output_file:
+                output_stream.close()
+        
+        return self.stats
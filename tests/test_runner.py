@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import deeptrans
+from deeptrans import ShardedTranslator
+
+
+# Runs in a child interpreter, since a leftover queue feeder thread hangs at exit
+SCRIPT = textwrap.dedent("""
+    import asyncio, sys, threading
+    from aiohttp import web
+    from deeptrans import ShardedTranslator, DeepLException
+
+    async def translate(request):
+        data = await request.json()
+        if "bad" in data["text"]:
+            return web.json_response({"message": "bad"}, status=400)
+        return web.json_response({"translations": [
+            {"text": text.upper(), "detected_source_language": "EN"} for text in data["text"]
+        ]})
+
+    def serve(started):
+        async def main():
+            app = web.Application()
+            app.router.add_post("/v2/translate", translate)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            started.port = site._server.sockets[0].getsockname()[1]
+            started.set()
+            await asyncio.Event().wait()
+        asyncio.run(main())
+
+    if __name__ == "__main__":
+        started = threading.Event()
+        threading.Thread(target=serve, args=(started,), daemon=True).start()
+        started.wait()
+        translator = ShardedTranslator(
+            "key", server_url=f"http://127.0.0.1:{started.port}", workers=2, batch_size=1
+        )
+        texts = ["bad" if sys.argv[1] == "error" else "first"] + ["x" * 200000] * 100
+        try:
+            for result in translator.translate(texts, target_lang="de"):
+                break
+        except DeepLException as e:
+            print(e)
+        print("done")
+""")
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ("error", "Bad request: bad"),
+    ("break", "done"),
+])
+def test_translate_returns_after_error_or_break(tmp_path, mode, expected):
+    pytest.importorskip("aiohttp")
+    script = tmp_path / "runner_script.py"
+    script.write_text(SCRIPT)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(deeptrans.__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    process = subprocess.run(
+        [sys.executable, str(script), mode], capture_output=True, text=True, timeout=60, env=env
+    )
+    assert process.returncode == 0, process.stderr
+    assert expected in process.stdout
+    assert process.stdout.rstrip().endswith("done")
+
+
+def test_translate_rejects_glossary_and_glossary_id():
+    translator = ShardedTranslator("key", workers=1)
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        next(translator.translate(
+            ["Hello"], target_lang="de", source_lang="en", glossary={"a": "b"}, glossary_id="id"
+        ))